@@ -3,6 +3,8 @@
 - 모든 사용자가 동일한 값을 보도록 Supabase DB에 공용 상태 저장/로드
 - 실행:  streamlit run timer_streamlit.py
 - 배포:  Streamlit Community Cloud에 올리고, Settings → Secrets에 SUPABASE_URL / SUPABASE_KEY 설정
+- 실시간 반영: timer_state 테이블을 supabase_realtime publication에 추가해야 UPDATE가 push됨
+  (하단 "Supabase 테이블 생성 SQL" 참고; 빠져 있어도 주기적 DB 확인으로 늦게나마 반영)
 - 시간대: Asia/Seoul 고정
 
 requirements.txt 예시
@@ -12,44 +14,123 @@ supabase
 """
 from __future__ import annotations
 
+import asyncio
+import json
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
 
+import httpx
 import streamlit as st
-from supabase import create_client, Client
+import streamlit.components.v1 as components
+from postgrest.exceptions import APIError
+from supabase import acreate_client, create_client, Client
 
 # ========================= 설정 ========================= #
 REAL_BASE_HMS = {"h": 20, "m": 0, "s": 0}   # 현실 기준 시작 (기본: 20:00)
 VIRT_BASE_HMS = {"h": 9,  "m": 0, "s": 0}   # 가상 기준 시작 (기본: 09:00)
 DEFAULT_SPEED = 3                                # 기본 배율 ×3
 SEOUL = ZoneInfo("Asia/Seoul")
+SEOUL_OFFSET = timedelta(hours=9)
 TABLE_NAME = "timer_state"                       # Supabase 테이블 이름
 ROW_ID = 1                                        # 단일 행 사용 (공용 타이머)
+STATE_COLUMNS = "real_base_iso,virt_base_iso,virt_adjust_sec,speed,updated_at"
+REFRESH_IDLE_MS = 1000                            # 평상시 원격 상태 확인 간격
+REFRESH_ACTIVE_MS = 250                           # 조정 직후 원격 상태 확인 간격
+ACTIVE_WINDOW_SEC = 5                             # 조정 후 빠른 확인 유지 시간
+REMOTE_FRESH_SEC = 2                              # 원격 상태 캐시를 그대로 쓰는 시간
+REMOTE_STALE_SEC = 30                             # 캐시를 쓰면서 백그라운드 갱신하는 시간
+CIRCUIT_MAX_FAILS = 3                             # 이 횟수만큼 연속 실패하면 원격 조회 중단
+CIRCUIT_WINDOW_SEC = 10                           # 연속 실패를 세는 시간 범위
+CIRCUIT_OPEN_SEC = 30                             # 원격 조회를 쉬는 시간
+REMOTE_ERRORS = (httpx.HTTPError, APIError)       # Supabase 호출에서 처리하는 오류
+REALTIME_CHECK_SEC = 5                            # Realtime 소켓·채널 상태 확인 주기
+REALTIME_STALE_SEC = 15                           # 이 시간 동안 확인이 없으면 폴링으로 대체
+REALTIME_RETRY_SEC = 60                           # 구독이 끝난 뒤 다시 시도하기까지의 시간
+
+logger = logging.getLogger(__name__)
 
 # ========================= 페이지 설정 & 스타일 ========================= #
 st.set_page_config(page_title="모의수사경진대회 시각 타이머", layout="wide")
+# rerun마다 다시 전송되므로 본문 페이지에서 쓰는 규칙만 남김 (시계 패널 스타일은 CLOCK_TEMPLATE에 있음)
 STYLE = """
 <style>
-  :root{ --bg:#000; --fg:#fff; --chip:#8f8f8f; --panel:#121212; --btn:#7f7f7f; --btn2:#2b2b2b; }
-  .titlechip{ background:var(--chip); color:#111; font-weight:800; letter-spacing:.06em; padding:8px 12px; border-radius:10px; text-align:center; width:100%; }
-  .panel{ background:var(--panel); border-radius:18px; padding:18px 22px; box-shadow:0 10px 30px rgba(0,0,0,.35); }
+  .titlechip{ background:#8f8f8f; color:#111; font-weight:800; letter-spacing:.06em; padding:8px 12px; border-radius:10px; text-align:center; width:100%; }
+  .legend{ font-size:12px; color:#aaa; margin-top:6px }
+  .block-container{padding-top: 0.8rem; padding-left: 1rem; padding-right: 2rem; max-width: 1200px;}
+</style>
+"""
+st.markdown(STYLE, unsafe_allow_html=True)
+
+# 고정 HTML 조각
+TITLE_VIRT_HTML = '<div class="titlechip">모의수사경진대회 시각</div>'
+TITLE_REAL_HTML = '<div class="titlechip">실제 시각</div>'
+
+# 시계 패널: 브라우저에서 1초마다 직접 갱신 (서버 rerun 없이 표시)
+CLOCK_TEMPLATE = """
+<style>
+  html, body{ margin:0; background:transparent; color:#fff; font-family:"Source Sans Pro", sans-serif; }
+  .panel{ background:#121212; border-radius:18px; padding:18px 22px; box-shadow:0 10px 30px rgba(0,0,0,.35); }
   .datebig{ font-size: clamp(28px, 6vw, 72px); font-weight:800; letter-spacing:.02em; margin:6px 0 10px; color:#dfe6ff; text-align:center; }
   .timebig{ font-size: clamp(80px, 17vw, 200px); font-weight:900; line-height:1; letter-spacing:.02em; text-align:center; word-break:keep-all; }
   .datesm{ font-size: clamp(16px, 3vw, 24px); color:#dfe6ff; margin:8px 0 6px; text-align:center; }
   .timesm{ font-size: clamp(40px, 8vw, 90px); font-weight:800; line-height:1.1; text-align:center; }
   .note{ margin-top:10px; color:#c5c5c5; font-size:12px; text-align:center; }
-  .legend{ font-size:12px; color:#aaa; margin-top:6px }
-  .block-container{padding-top: 0.8rem; padding-left: 1rem; padding-right: 2rem; max-width: 1200px;}
 </style>
+<div class="panel">
+  <div id="date"></div>
+  <div id="time"></div>
+  <div class="note" id="note"></div>
+</div>
+<script>
+  const cfg = __CFG__;
+  const KST_MS = 9 * 3600 * 1000;
+  const p2 = (n) => String(n).padStart(2, "0");
+  // 모든 화면이 같은 시각을 보이도록 PC 시계 대신 서버 시각 기준으로 보정
+  const offset = cfg.server_ms - Date.now();
+  document.getElementById("date").className = cfg.virtual ? "datebig" : "datesm";
+  document.getElementById("time").className = cfg.virtual ? "timebig" : "timesm";
+  document.getElementById("note").textContent = cfg.note || "";
+  function tick() {
+    const now = Date.now() + offset;
+    let t = Math.floor(now / 1000) * 1000;
+    if (cfg.virtual) {
+      // 가상 = 가상 기준 + (현실경과 정수초 × 배율) + 보정
+      const elapsed = Math.trunc((now - cfg.real_base_ms) / 1000);
+      t = Math.floor((cfg.virt_base_ms + elapsed * cfg.speed * 1000 + cfg.adjust_ms) / 1000) * 1000;
+    }
+    const d = new Date(t + KST_MS);
+    document.getElementById("date").textContent =
+      d.getUTCFullYear() + "-" + p2(d.getUTCMonth() + 1) + "-" + p2(d.getUTCDate());
+    document.getElementById("time").textContent =
+      p2(d.getUTCHours()) + ":" + p2(d.getUTCMinutes()) + ":" + p2(d.getUTCSeconds());
+    setTimeout(tick, 1000 - ((Date.now() + offset) % 1000));
+  }
+  tick();
+</script>
 """
-st.markdown(STYLE, unsafe_allow_html=True)
 
 # ========================= DB 연결 ========================= #
 @st.cache_resource
 def get_client() -> Client:
     url = st.secrets["SUPABASE_URL"]
     key = st.secrets["SUPABASE_KEY"]
-    return create_client(url, key)
+    client = create_client(url, key)
+    # PostgREST 세션을 keep-alive + HTTP/2 커넥션 풀로 교체 (base_url/헤더는 유지)
+    rest = client.postgrest
+    old_session = rest.session
+    rest.session = httpx.Client(
+        base_url=old_session.base_url,
+        headers=old_session.headers,
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=10, max_connections=20, keepalive_expiry=30.0),
+        timeout=httpx.Timeout(5.0, connect=2.0),
+    )
+    old_session.close()
+    return client
 
 supabase: Client | None = None
 try:
@@ -59,23 +140,68 @@ except Exception:
 
 # ========================= 유틸 ========================= #
 
-def pad(n: int) -> str:
-    return str(n).zfill(2)
-
 def fmt_date(dt: datetime) -> str:
-    return f"{dt.year}-{pad(dt.month)}-{pad(dt.day)}"
+    return dt.strftime("%Y-%m-%d")
 
 def fmt_hms(dt: datetime) -> str:
-    return f"{pad(dt.hour)}:{pad(dt.minute)}:{pad(dt.second)}"
+    return dt.strftime("%H:%M:%S")
+
+# rerun 한 번 안에서 같은 시각을 여러 곳에 표시할 때 재사용 (스크립트가 다시 실행되면 비워짐)
+_fmt_cache: dict[datetime, tuple[str, str]] = {}
+
+def render_dt(dt: datetime) -> tuple[str, str]:
+    """(날짜, 시:분:초) 문자열"""
+    key = dt.replace(microsecond=0)
+    if key not in _fmt_cache:
+        _fmt_cache[key] = (fmt_date(key), fmt_hms(key))
+    return _fmt_cache[key]
+
+@st.cache_resource
+def _adj_text_cache() -> dict[int, str]:
+    return {}
+
+def _fmt_adj_int(total: int) -> str:
+    sign = "+" if total >= 0 else "-"
+    q, s = divmod(abs(total), 60)
+    q, m = divmod(q, 60)
+    d, h = divmod(q, 24)
+    return f"{sign}{d}일 {h:02d}:{m:02d}:{s:02d}"
 
 def fmt_adj(td: timedelta) -> str:
+    # 보정값은 조정할 때만 바뀌므로 문자열을 재사용
     total = int(td.total_seconds())
-    sign = "+" if total >= 0 else "-"
-    a = abs(total)
-    d, rem = divmod(a, 86400)
-    h, rem = divmod(rem, 3600)
-    m, s = divmod(rem, 60)
-    return f"{sign}{d}일 {pad(h)}:{pad(m)}:{pad(s)}"
+    cache = _adj_text_cache()
+    text = cache.get(total)
+    if text is None:
+        if len(cache) >= 128:
+            cache.clear()
+        text = cache[total] = _fmt_adj_int(total)
+    return text
+
+def clock_html(virtual: bool) -> str:
+    """시계 패널 HTML (브라우저는 server_ms와의 차이만큼 자기 시계를 보정해 1초마다 갱신)
+    상태가 그대로면 이전과 같은 HTML을 돌려줘 rerun해도 iframe이 다시 로드되지 않음
+    """
+    cfg = {"virtual": virtual}
+    if virtual:
+        rb = st.session_state.real_base
+        vb = st.session_state.virt_base
+        speed = st.session_state.speed
+        cfg.update(
+            real_base_ms=int(rb.timestamp() * 1000),
+            virt_base_ms=int(vb.timestamp() * 1000),
+            speed=int(speed),
+            adjust_ms=st.session_state.virt_adjust // timedelta(milliseconds=1),
+            note=f"기준(현실 {render_dt(rb)[1]}) → (가상 {render_dt(vb)[1]}) · 배율 ×{speed}",
+        )
+    key = "_clock_virt" if virtual else "_clock_real"
+    cached = st.session_state.get(key)
+    if cached is None or cached[0] != cfg:
+        # 어차피 다시 로드될 때만 렌더 직전의 서버 시각을 새로 넣음 (rerun 시작 시각이 아니라)
+        server_ms = int(datetime.now(SEOUL).timestamp() * 1000)
+        html = CLOCK_TEMPLATE.replace("__CFG__", json.dumps({**cfg, "server_ms": server_ms}, ensure_ascii=False))
+        st.session_state[key] = cached = (cfg, html)
+    return cached[1]
 
 def get_default_real_base(now: datetime) -> datetime:
     base = now.replace(hour=REAL_BASE_HMS["h"], minute=REAL_BASE_HMS["m"], second=REAL_BASE_HMS["s"], microsecond=0)
@@ -86,37 +212,185 @@ def get_default_real_base(now: datetime) -> datetime:
 def get_default_virt_base(real_base: datetime) -> datetime:
     return real_base.replace(hour=VIRT_BASE_HMS["h"], minute=VIRT_BASE_HMS["m"], second=VIRT_BASE_HMS["s"], microsecond=0)
 
-def compute_virtual(now: datetime) -> datetime:
-    """가상 = 가상 기준 + (현실경과 × 배율) + 보정 (정수초)"""
+def compute_virtual_no_adjust(now: datetime) -> datetime:
+    """가상 기준 + (현실경과 정수초 × 배율); 보정 계산과 표시가 같은 식을 쓰도록 공유"""
     rb = st.session_state.real_base
     vb = st.session_state.virt_base
     speed = st.session_state.speed
-    adj = st.session_state.virt_adjust
-    elapsed = now - rb
-    vn = vb + timedelta(seconds=elapsed.total_seconds() * speed) + adj
+    elapsed_s = int((now - rb).total_seconds())
+    return vb + timedelta(seconds=elapsed_s * speed)
+
+def compute_virtual(now: datetime) -> datetime:
+    """가상 = 가상 기준 + (현실경과 × 배율) + 보정 (정수초)"""
+    vn = compute_virtual_no_adjust(now) + st.session_state.virt_adjust
     return vn.replace(microsecond=0)
 
 # ========================= 원격 상태 I/O ========================= #
 
 def to_iso(dt: datetime) -> str:
-    return dt.astimezone(SEOUL).isoformat()
+    # 이 모듈의 시각은 모두 SEOUL 기준이므로 보통은 변환 없이 바로 직렬화
+    return dt.isoformat() if dt.tzinfo is SEOUL else dt.astimezone(SEOUL).isoformat()
+
+@st.cache_resource
+def _iso_cache() -> dict[str, datetime]:
+    return {}
 
 def from_iso(s: str) -> datetime:
-    # fromisoformat이 tz-naive여도 astimezone 처리에서 오류 방지
+    # 기준 시각 문자열은 조정할 때만 바뀌므로 파싱 결과를 재사용
+    cache = _iso_cache()
+    dt = cache.get(s)
+    if dt is not None:
+        return dt
+    # to_iso는 항상 +09:00으로 저장하므로 시간대만 SEOUL로 바꿔 끼움 (서울은 서머타임 없음)
+    # tz-naive 값도 서울 시각으로 간주; 다른 오프셋일 때만 변환
     dt = datetime.fromisoformat(s)
-    if dt.tzinfo is None:
+    if dt.tzinfo is None or dt.utcoffset() == SEOUL_OFFSET:
         dt = dt.replace(tzinfo=SEOUL)
-    return dt.astimezone(SEOUL)
+    else:
+        dt = dt.astimezone(SEOUL)
+    if len(cache) >= 64:
+        cache.clear()
+    cache[s] = dt
+    return dt
+
+def same_instant(a: str | None, b: str | None) -> bool:
+    """updated_at 비교: 저장 시 문자열(+09:00)과 PostgREST 응답(+00:00) 표기가 달라도 같은 시각이면 True"""
+    if a is None or b is None or a == b:
+        return a == b
+    try:
+        return datetime.fromisoformat(a) == datetime.fromisoformat(b)
+    except ValueError:
+        return False
+
+@st.cache_resource
+def get_circuit() -> dict:
+    """원격 조회 차단기 (모든 세션 공용): 연속 실패 시 잠시 조회를 건너뜀"""
+    return {"failures": [], "open_until": 0.0, "lock": threading.Lock()}
+
+circuit = get_circuit()  # 백그라운드 스레드에서도 쓰므로 스크립트 스레드에서 미리 가져옴
+
+def circuit_open() -> bool:
+    return time.time() < circuit["open_until"]
+
+def record_remote_result(ok: bool):
+    now = time.time()
+    with circuit["lock"]:
+        if ok:
+            circuit["failures"] = []
+            return
+        circuit["failures"] = [t for t in circuit["failures"] if now - t < CIRCUIT_WINDOW_SEC] + [now]
+        if len(circuit["failures"]) >= CIRCUIT_MAX_FAILS:
+            circuit["open_until"] = now + CIRCUIT_OPEN_SEC
+            circuit["failures"] = []
+
+def _select_rows(columns: str) -> list[dict] | None:
+    """조회 결과 행 목록 (조회 실패 시 None: 행이 없는 경우([])와 구분)"""
+    try:
+        resp = supabase.table(TABLE_NAME).select(columns).eq("id", ROW_ID).execute()
+    except REMOTE_ERRORS:
+        record_remote_result(False)
+        return None
+    record_remote_result(True)
+    return resp.data or []
+
+def _fetch_remote_state(columns: str = STATE_COLUMNS) -> dict | None:
+    rows = _select_rows(columns)
+    return rows[0] if rows else None
+
+@st.cache_resource
+def get_remote_cache() -> dict:
+    """원격 행 캐시 (모든 세션 공용, stale-while-revalidate)
+    - lock: row/fetched_at/gen/pending 읽기·쓰기, fetch_lock: 동시 조회 중복 제거
+    - gen: 저장할 때마다 증가 (조회 도중 저장이 끼어들면 조회 결과를 버림)
+    - pending: 아직 끝나지 않은 저장 수 (그동안 DB 값은 저장 이전 값일 수 있음)
+    """
+    return {
+        "row": None, "fetched_at": 0.0, "gen": 0, "pending": 0,
+        "lock": threading.Lock(), "fetch_lock": threading.Lock(),
+    }
+
+def _refresh_remote_cache(cache: dict) -> dict | None:
+    # 동시에 여러 세션이 조회하려 하면 한 번만 가져오고 나머지는 그 결과를 사용
+    started = time.time()
+    with cache["fetch_lock"]:
+        with cache["lock"]:
+            if cache["fetched_at"] >= started or cache["pending"]:
+                return cache["row"]
+            gen = cache["gen"]
+            cached = cache["row"]
+        # updated_at만 먼저 확인하고, 바뀐 경우에만 전체 컬럼 조회
+        row = None
+        if cached is not None:
+            probe = _fetch_remote_state("updated_at")
+            if probe is not None and same_instant(probe.get("updated_at"), cached.get("updated_at")):
+                row = cached
+        if row is None:
+            row = _fetch_remote_state()
+        with cache["lock"]:
+            # 조회하는 사이 저장이 있었으면 방금 읽은 (저장 이전일 수 있는) 행으로 덮어쓰지 않음
+            if cache["gen"] != gen or cache["pending"]:
+                return cache["row"]
+            if row is not None:
+                cache["row"] = row
+                cache["fetched_at"] = time.time()
+        return row
 
 def load_remote_state() -> dict | None:
     if not supabase:
         return None
+    cache = get_remote_cache()
+    if circuit_open():
+        return cache["row"]
+    age = time.time() - cache["fetched_at"]
+    if cache["row"] is not None and age < REMOTE_FRESH_SEC:
+        return cache["row"]
+    if cache["row"] is not None and age < REMOTE_STALE_SEC:
+        # 저장 대기 중에는 갱신해도 결과를 버리므로 스레드를 만들지 않음
+        if not cache["pending"] and not cache["fetch_lock"].locked():
+            threading.Thread(target=_refresh_remote_cache, args=(cache,), daemon=True).start()
+        return cache["row"]
+    return _refresh_remote_cache(cache)
+
+def load_initial_state() -> tuple[bool, dict | None]:
+    """최초 기동용: (원격 상태를 확인했는지, 행)
+    - 차단기가 열려 있거나 조회에 실패하면 (False, None): 행이 없다고 단정하지 않음
+    - 조회에 성공했는데 행이 없을 때만 (True, None)
+    """
+    row = load_remote_state()
+    if row is not None:
+        return True, row
+    if not supabase or circuit_open():
+        return False, None
+    rows = _select_rows(STATE_COLUMNS)
+    if rows is None:
+        return False, None
+    return True, (rows[0] if rows else None)
+
+@st.cache_resource
+def get_save_executor() -> ThreadPoolExecutor:
+    # 작업자 1개: 저장 순서가 뒤바뀌어 이전 값이 마지막에 남는 일을 막음
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="timer-save")
+
+def _do_upsert(payload: dict, cache: dict, cache_prev: dict | None, hub: dict, hub_prev: dict | None) -> str:
+    ok = False
     try:
-        resp = supabase.table(TABLE_NAME).select("*").eq("id", ROW_ID).execute()
-        rows = resp.data or []
-        return rows[0] if rows else None
-    except Exception:
-        return None
+        supabase.table(TABLE_NAME).upsert(payload, on_conflict="id", returning="minimal").execute()
+        ok = True
+    finally:
+        record_remote_result(ok)
+        # 저장에 실패하면 모든 세션이 저장되지 않은 값을 보지 않도록 공용 캐시/허브를 되돌림
+        # (그 사이 다른 값으로 바뀌었으면 그대로 둠)
+        with cache["lock"]:
+            cache["pending"] -= 1
+            cache["gen"] += 1
+            if not ok and cache["row"] is payload:
+                cache["row"] = cache_prev
+                cache["fetched_at"] = 0.0  # 다음 조회에서 DB 값으로 다시 확인
+        if not ok:
+            with hub["lock"]:
+                if hub["row"] is payload:
+                    hub["row"] = hub_prev
+    return payload["updated_at"]
 
 def save_remote_state():
     if not supabase:
@@ -129,15 +403,42 @@ def save_remote_state():
         "speed": int(st.session_state.speed),
         "updated_at": datetime.now(SEOUL).isoformat(),
     }
+    # 저장한 값을 그대로 적용하므로 응답 본문 없이도 다음 rerun에서 자기 변경을 다시 읽지 않음
+    apply_remote_state(payload)
+    # 캐시에 바로 반영해 오래된 행이 방금 저장한 값을 덮어쓰지 않도록 함
+    cache = get_remote_cache()
+    with cache["lock"]:
+        cache_prev = cache["row"]
+        cache["row"] = payload
+        cache["fetched_at"] = time.time()
+        cache["gen"] += 1
+        cache["pending"] += 1
+    # Realtime 경로도 echo가 오기 전까지 이전 push 행으로 되돌아가지 않도록 같은 값으로 갱신
+    hub = get_realtime_hub()
+    with hub["lock"]:
+        hub_prev = hub["row"]
+        hub["row"] = payload
+    # 네트워크 왕복은 백그라운드에서 처리하고 결과는 다음 rerun에서 확인 (실패 시 되돌리기도 작업 스레드에서)
+    st.session_state.save_future = get_save_executor().submit(
+        _do_upsert, payload, cache, cache_prev, hub, hub_prev,
+    )
+
+def check_pending_save():
+    fut = st.session_state.get("save_future")
+    if fut is None or not fut.done():
+        return
+    st.session_state.save_future = None
     try:
-        supabase.table(TABLE_NAME).upsert(payload).execute()
-        st.session_state.last_saved_at = payload["updated_at"]
-    except Exception as e:
+        st.session_state.last_saved_at = fut.result()
+    except Exception as e:  # 되돌리기는 _do_upsert에서 끝났으므로 알리기만 함
         st.warning("원격 저장 실패: " + str(e))
 
 # 원격 → 로컬 적용
 
-def apply_remote_state(row: dict):
+def apply_remote_state(row: dict) -> bool:
+    """로컬에 적용했으면 True (이미 같은 updated_at이거나 형식 오류면 False)"""
+    if same_instant(row.get("updated_at"), st.session_state.get("last_loaded_at")):
+        return False
     try:
         if row.get("real_base_iso"):
             st.session_state.real_base = from_iso(row["real_base_iso"]) 
@@ -146,13 +447,116 @@ def apply_remote_state(row: dict):
         st.session_state.virt_adjust = timedelta(seconds=int(row.get("virt_adjust_sec", 0)))
         st.session_state.speed = int(row.get("speed", DEFAULT_SPEED))
         st.session_state.last_loaded_at = row.get("updated_at")
+    except (ValueError, TypeError):
+        return False
+    return True
+
+# ========================= 원격 변경 구독 (Realtime) ========================= #
+
+@st.cache_resource
+def get_realtime_hub() -> dict:
+    """timer_state 행 UPDATE를 구독하고 최신 행을 보관 (모든 세션 공용)
+    - hub["row"]: 마지막으로 받은 행 (없으면 None)
+    - hub["alive_at"]: 소켓·채널 상태를 마지막으로 확인한 시각 (오래되면 폴링으로 대체)
+    - hub["failed_at"]: 구독이 끝난 시각 (REALTIME_RETRY_SEC 뒤 다시 시도)
+    """
+    hub = {"row": None, "alive_at": 0.0, "failed_at": 0.0, "lock": threading.Lock()}
+    if supabase:
+        # 동기 클라이언트는 Realtime을 지원하지 않으므로 별도 이벤트 루프 스레드에서 비동기 클라이언트로 구독
+        url = st.secrets["SUPABASE_URL"]
+        key = st.secrets["SUPABASE_KEY"]
+        threading.Thread(
+            target=_run_realtime, args=(hub, get_remote_cache(), url, key), daemon=True, name="timer-realtime",
+        ).start()
+    return hub
+
+def _is_newer(row: dict, current: dict | None) -> bool:
+    # 늦게 도착한 이전 변경(echo)이 더 최근 값을 덮어쓰지 않도록
+    if current is None:
+        return True
+    try:
+        return datetime.fromisoformat(row["updated_at"]) >= datetime.fromisoformat(current["updated_at"])
+    except (KeyError, TypeError, ValueError):
+        return True
+
+def _run_realtime(hub: dict, cache: dict, url: str, key: str):
+    try:
+        asyncio.run(_realtime_main(hub, cache, url, key))
     except Exception:
-        pass
+        logger.warning("Realtime 구독 실패: 폴링으로 대체", exc_info=True)
+    with hub["lock"]:
+        hub["alive_at"] = 0.0
+        hub["failed_at"] = time.time()
+
+async def _realtime_main(hub: dict, cache: dict, url: str, key: str):
+    client = await acreate_client(url, key)
+    subscribed = asyncio.Event()
+
+    def _on_status(status, err):
+        if status == "SUBSCRIBED":
+            subscribed.set()
+
+    def _on_change(payload: dict):
+        row = (payload.get("data") or {}).get("record")
+        if not row:
+            return
+        with hub["lock"]:
+            if _is_newer(row, hub["row"]):
+                hub["row"] = row
+        # 폴링으로 돌아가도 오래된 캐시 행이 적용되지 않도록 캐시도 갱신
+        with cache["lock"]:
+            if _is_newer(row, cache["row"]):
+                cache["row"] = row
+                cache["fetched_at"] = time.time()
+                cache["gen"] += 1
+
+    channel = client.channel("timer")
+    channel.on_postgres_changes(
+        "UPDATE", schema="public", table=TABLE_NAME, filter=f"id=eq.{ROW_ID}", callback=_on_change,
+    )
+    try:
+        await channel.subscribe(_on_status)  # 소켓 연결 + 수신/heartbeat 태스크 시작
+        await asyncio.wait_for(subscribed.wait(), timeout=REALTIME_STALE_SEC)
+        # 소켓과 채널이 살아 있는 동안 주기적으로 alive_at 갱신; 끊기면 빠져나가 폴링으로 대체
+        while client.realtime.is_connected and channel.is_joined:
+            with hub["lock"]:
+                hub["alive_at"] = time.time()
+            await asyncio.sleep(REALTIME_CHECK_SEC)
+    finally:
+        await client.realtime.close()
+
+def realtime_alive(hub: dict) -> bool:
+    return time.time() - hub["alive_at"] < REALTIME_STALE_SEC
+
+def pull_realtime_row(hub: dict) -> dict | None:
+    with hub["lock"]:
+        return hub["row"]
+
+def pull_remote_row() -> dict | None:
+    """이번 rerun에 적용할 원격 행 (Realtime push가 살아 있으면 push 우선, 아니면 폴링)"""
+    hub = get_realtime_hub()
+    if hub["failed_at"] and time.time() - hub["failed_at"] > REALTIME_RETRY_SEC:
+        get_realtime_hub.clear()  # 끝난 구독을 버리고 새로 시도
+        hub = get_realtime_hub()
+    if not realtime_alive(hub):
+        return load_remote_state()
+    # 채널 참여만으로는 전달이 보장되지 않음 (publication 누락, 재연결 중 유실된 이벤트)
+    # → 구독 중에도 REMOTE_STALE_SEC마다 DB를 확인하고, 둘 중 더 최근 행을 사용
+    now = time.time()
+    if now - st.session_state.get("last_confirm_ts", 0.0) >= REMOTE_STALE_SEC:
+        st.session_state.last_confirm_ts = now
+        polled = load_remote_state()
+    else:
+        polled = get_remote_cache()["row"]
+    row = pull_realtime_row(hub)
+    if polled is not None and (row is None or not _is_newer(row, polled)):
+        row = polled
+    return row
 
 # ========================= 초기화 ========================= #
-now0 = datetime.now(SEOUL)
+now_ts = datetime.now(SEOUL)  # rerun 전체에서 공유하는 현재 시각
 if "initialized" not in st.session_state:
-    real_base = get_default_real_base(now0)
+    real_base = get_default_real_base(now_ts)
     virt_base = get_default_virt_base(real_base)
     st.session_state.real_base = real_base
     st.session_state.virt_base = virt_base
@@ -163,51 +567,34 @@ if "initialized" not in st.session_state:
     st.session_state.initialized = True
     st.session_state.last_loaded_at = None
     st.session_state.last_saved_at = None
+    st.session_state.last_interaction_ts = 0.0
 
-    # 최초 기동 시 원격 상태 적용 (없으면 생성)
-    row = load_remote_state()
-    if row is None and supabase:
-        save_remote_state()  # 기본값을 원격에 생성
-    elif row is not None:
+    # 최초 기동 시 원격 상태 적용 (조회에 성공했는데 행이 없을 때만 생성)
+    known, row = load_initial_state()
+    if row is not None:
         apply_remote_state(row)
+    elif known:
+        save_remote_state()  # 기본값을 원격에 생성
 
-# ========================= 자동 새로고침 & 원격 pull ========================= #
-try:
-    st.autorefresh(interval=500, key="_tick")  # 0.5초
-except Exception:
-    pass
-
-if supabase:
-    row = load_remote_state()
-    if row and row.get("updated_at") != st.session_state.last_loaded_at:
+# ========================= 원격 pull ========================= #
+# 저장 결과 확인은 페이지 끝의 remote_poller에서 함 (경고가 위쪽에 끼어들어 시계 iframe 위치가 바뀌지 않도록)
+# 이번 rerun에 콜백으로 들어온 로컬 조정이 있으면 원격 값으로 덮어쓰지 않음
+if supabase and not st.session_state.get("pending_save"):
+    row = pull_remote_row()
+    if row:
         apply_remote_state(row)
 
 # ========================= 레이아웃 ========================= #
 left, right = st.columns([1.6, 0.9])
 
+# 시계 패널은 자리만 잡아 두고, 조정 처리가 끝난 뒤(스크립트 끝)에서 채움
 with left:
-    st.markdown('<div class="titlechip">모의수사경진대회 시각</div>', unsafe_allow_html=True)
-    with st.container(border=False):
-        st.markdown('<div class="panel">', unsafe_allow_html=True)
-        now1 = datetime.now(SEOUL)
-        vnow = compute_virtual(now1)
-        st.markdown(f'<div class="datebig">{fmt_date(vnow)}</div>', unsafe_allow_html=True)
-        st.markdown(f'<div class="timebig">{fmt_hms(vnow)}</div>', unsafe_allow_html=True)
-        rb = st.session_state.real_base
-        vb = st.session_state.virt_base
-        speed = st.session_state.speed
-        meta = f"기준(현실 {fmt_hms(rb)}) → (가상 {fmt_hms(vb)}) · 배율 ×{speed}"
-        st.markdown(f'<div class="note">{meta}</div>', unsafe_allow_html=True)
-        st.markdown('</div>', unsafe_allow_html=True)
+    st.markdown(TITLE_VIRT_HTML, unsafe_allow_html=True)
+    virt_clock = st.empty()
 
 with right:
-    st.markdown('<div class="titlechip">실제 시각</div>', unsafe_allow_html=True)
-    with st.container(border=False):
-        st.markdown('<div class="panel">', unsafe_allow_html=True)
-        now2 = datetime.now(SEOUL)
-        st.markdown(f'<div class="datesm">{fmt_date(now2)}</div>', unsafe_allow_html=True)
-        st.markdown(f'<div class="timesm">{fmt_hms(now2)}</div>', unsafe_allow_html=True)
-        st.markdown('</div>', unsafe_allow_html=True)
+    st.markdown(TITLE_REAL_HTML, unsafe_allow_html=True)
+    real_clock = st.empty()
 
     st.markdown("\n")
     c1, c2 = st.columns([1,1])
@@ -218,82 +605,73 @@ with right:
 
 st.divider()
 
-# ========================= 조정 패널: 현실 기준 ========================= #
+# ========================= 조정 패널: 기준 시각 ========================= #
+# 보정 단계 (표시 순서대로); 기준 시각 조정은 +10분을 뺀 같은 단계에 초기화를 더해 사용
+ADJUST_MAP = {
+    "+1일": timedelta(days=1),
+    "-1일": -timedelta(days=1),
+    "+1시간": timedelta(hours=1),
+    "-1시간": -timedelta(hours=1),
+    "+10분": timedelta(minutes=10),
+    "+1분": timedelta(minutes=1),
+    "-1분": -timedelta(minutes=1),
+}
+BASE_ACTIONS = {
+    **{label: delta for label, delta in ADJUST_MAP.items() if label != "+10분"},
+    "초기화": None,                                # None: 처음 기준값으로 되돌림
+}
+SPEED_OPTIONS = [1, 2, 3, 4, 6, 9]
+
+def on_step_action(widget_key: str, field: str, actions: dict[str, timedelta | None]):
+    action = st.session_state[widget_key]
+    if action is None:
+        return
+    delta = actions[action]
+    if delta is None:
+        st.session_state[field] = st.session_state[field + "_init"]
+    else:
+        st.session_state[field] += delta
+    st.session_state[widget_key] = None  # 같은 버튼을 연속으로 누를 수 있도록 선택 해제
+    st.session_state.pending_save = True
+
+def on_speed_action():
+    sp = st.session_state.speed_act
+    if sp is None:
+        return
+    st.session_state.speed = sp
+    st.session_state.speed_act = None
+    st.session_state.pending_save = True
+
 sub1, sub2 = st.columns(2)
 
 with sub1:
     st.subheader("현실 기준 시작 (기본: 오늘 20:00, 이전이면 어제 20:00)")
-    r1, r2, r3, r4, r5 = st.columns(5)
-    changed = False
-    if r1.button("+1일", use_container_width=True):
-        st.session_state.real_base += timedelta(days=1); changed=True
-    if r2.button("-1일", use_container_width=True):
-        st.session_state.real_base -= timedelta(days=1); changed=True
-    if r3.button("+1시간", use_container_width=True):
-        st.session_state.real_base += timedelta(hours=1); changed=True
-    if r4.button("-1시간", use_container_width=True):
-        st.session_state.real_base -= timedelta(hours=1); changed=True
-    if r5.button("초기화", use_container_width=True):
-        st.session_state.real_base = st.session_state.real_base_init; changed=True
-
-    r6, r7 = st.columns(2)
-    if r6.button("+1분", use_container_width=True):
-        st.session_state.real_base += timedelta(minutes=1); changed=True
-    if r7.button("-1분", use_container_width=True):
-        st.session_state.real_base -= timedelta(minutes=1); changed=True
-
-    st.markdown(f"<div class='legend'>기준: {fmt_date(st.session_state.real_base)} {fmt_hms(st.session_state.real_base)}</div>", unsafe_allow_html=True)
-    if changed:
-        save_remote_state()
-
-# ========================= 조정 패널: 가상 기준 ========================= #
+    st.segmented_control(
+        "현실 기준", options=list(BASE_ACTIONS), default=None, key="rb_act",
+        on_change=on_step_action, args=("rb_act", "real_base", BASE_ACTIONS), label_visibility="collapsed",
+    )
+    st.markdown(f"<div class='legend'>기준: {' '.join(render_dt(st.session_state.real_base))}</div>", unsafe_allow_html=True)
+
 with sub2:
     st.subheader("가상 기준 시작 (기본: 같은 날 09:00)")
-    v1, v2, v3, v4, v5 = st.columns(5)
-    changed2 = False
-    if v1.button("+1일", use_container_width=True):
-        st.session_state.virt_base += timedelta(days=1); changed2=True
-    if v2.button("-1일", use_container_width=True):
-        st.session_state.virt_base -= timedelta(days=1); changed2=True
-    if v3.button("+1시간", use_container_width=True):
-        st.session_state.virt_base += timedelta(hours=1); changed2=True
-    if v4.button("-1시간", use_container_width=True):
-        st.session_state.virt_base -= timedelta(hours=1); changed2=True
-    if v5.button("초기화", use_container_width=True):
-        st.session_state.virt_base = st.session_state.virt_base_init; changed2=True
-
-    v6, v7 = st.columns(2)
-    if v6.button("+1분", use_container_width=True):
-        st.session_state.virt_base += timedelta(minutes=1); changed2=True
-    if v7.button("-1분", use_container_width=True):
-        st.session_state.virt_base -= timedelta(minutes=1); changed2=True
-
-    st.markdown(f"<div class='legend'>기준: {fmt_date(st.session_state.virt_base)} {fmt_hms(st.session_state.virt_base)}</div>", unsafe_allow_html=True)
-    if changed2:
-        save_remote_state()
+    st.segmented_control(
+        "가상 기준", options=list(BASE_ACTIONS), default=None, key="vb_act",
+        on_change=on_step_action, args=("vb_act", "virt_base", BASE_ACTIONS), label_visibility="collapsed",
+    )
+    st.markdown(f"<div class='legend'>기준: {' '.join(render_dt(st.session_state.virt_base))}</div>", unsafe_allow_html=True)
 
 # ========================= 보정(현재 가상 시각 기준) ========================= #
 st.subheader("경진대회 시각(현재) 보정")
 st.caption("현재 화면의 대회 시각을 기준으로 하루/시간/분 단위로 보정하거나, 아래 입력값으로 바로 맞춥니다.")
 
-adj_cols = st.columns(7)
-btns = [
-    ("+1일", timedelta(days=1)),
-    ("-1일", -timedelta(days=1)),
-    ("+1시간", timedelta(hours=1)),
-    ("-1시간", -timedelta(hours=1)),
-    ("+10분", timedelta(minutes=10)),
-    ("+1분", timedelta(minutes=1)),
-    ("-1분", -timedelta(minutes=1)),
-]
+st.segmented_control(
+    "보정", options=list(ADJUST_MAP), default=None, key="adj_act",
+    on_change=on_step_action, args=("adj_act", "virt_adjust", ADJUST_MAP), label_visibility="collapsed",
+)
 changed3 = False
-for i, (label, delta) in enumerate(btns):
-    if adj_cols[i].button(label, use_container_width=True):
-        st.session_state.virt_adjust += delta
-        changed3 = True
 
-vnow_live = compute_virtual(datetime.now(SEOUL))
-st.markdown(f"<div class='legend'>현재 대회 시각: {fmt_date(vnow_live)} {fmt_hms(vnow_live)}</div>", unsafe_allow_html=True)
+vnow_live = compute_virtual(now_ts)
+st.markdown(f"<div class='legend'>현재 대회 시각: {' '.join(render_dt(vnow_live))}</div>", unsafe_allow_html=True)
 
 c_date, c_time, c_apply, c_reset = st.columns([1.2, 1.2, 1.5, 1])
 with c_date:
@@ -303,8 +681,7 @@ with c_time:
 with c_apply:
     if st.button("지금 시각을 이 값으로 맞춤", use_container_width=True):
         target = datetime.combine(date_input, time_input).replace(tzinfo=SEOUL)
-        nowx = datetime.now(SEOUL)
-        base_no_adj = st.session_state.virt_base + (nowx - st.session_state.real_base) * st.session_state.speed
+        base_no_adj = compute_virtual_no_adjust(now_ts)
         st.session_state.virt_adjust = target - base_no_adj
         changed3 = True
 with c_reset:
@@ -313,38 +690,66 @@ with c_reset:
         changed3 = True
 
 st.markdown(f"<div class='legend'>보정: {fmt_adj(st.session_state.virt_adjust)}</div>", unsafe_allow_html=True)
-if changed3:
-    save_remote_state()
 
 # ========================= 배율 ========================= #
 st.subheader("배율 (현실 → 가상)")
-sp_cols = st.columns(6)
-changed4 = False
-for i, sp in enumerate([1, 2, 3, 4, 6, 9]):
-    if sp_cols[i].button(f"×{sp}", use_container_width=True):
-        st.session_state.speed = sp
-        changed4 = True
+st.segmented_control(
+    "배율", options=SPEED_OPTIONS, format_func=lambda sp: f"×{sp}", default=None, key="speed_act",
+    on_change=on_speed_action, label_visibility="collapsed",
+)
 st.markdown(f"<div class='legend'>현재 배율: ×{st.session_state.speed}</div>", unsafe_allow_html=True)
-if changed4:
-    save_remote_state()
 
 st.divider()
 
 # ========================= 초기화 & 안내 ========================= #
 c_l, c_r = st.columns([1, 1])
+reset_all = False
 with c_l:
     if st.button("모두 초기화"):
-        nowx = datetime.now(SEOUL)
-        st.session_state.real_base = get_default_real_base(nowx)
+        st.session_state.real_base = get_default_real_base(now_ts)
         st.session_state.virt_base = get_default_virt_base(st.session_state.real_base)
         st.session_state.real_base_init = st.session_state.real_base
         st.session_state.virt_base_init = st.session_state.virt_base
         st.session_state.virt_adjust = timedelta(0)
         st.session_state.speed = DEFAULT_SPEED
-        save_remote_state()
+        reset_all = True
 with c_r:
     st.caption("*전체화면은 브라우저(F11) 또는 OS 단축키를 이용하세요. 모든 조정은 DB에 저장되어 공용으로 반영됩니다.")
 
+# ========================= 시계 패널 ========================= #
+with virt_clock:
+    components.html(clock_html(virtual=True), height=330)
+with real_clock:
+    components.html(clock_html(virtual=False), height=200)
+
+# ========================= 원격 저장 (rerun당 1회) ========================= #
+# 기준/보정/배율 단계 조정은 위젯 콜백에서 pending_save로 표시됨
+if any([st.session_state.pop("pending_save", False), changed3, reset_all]):
+    st.session_state.last_interaction_ts = time.time()
+    save_remote_state()
+
+# ========================= 주기적 원격 확인 ========================= #
+def current_refresh_sec() -> float:
+    # 조정 중에는 빠르게, 평상시에는 1초 간격으로
+    recently_active = time.time() - st.session_state.last_interaction_ts < ACTIVE_WINDOW_SEC
+    return (REFRESH_ACTIVE_MS if recently_active else REFRESH_IDLE_MS) / 1000
+
+refresh_sec = current_refresh_sec()
+
+@st.fragment(run_every=refresh_sec)
+def remote_poller():
+    """fragment만 주기적으로 다시 실행해 원격 상태를 확인 (시계 패널은 다시 그리지 않음)
+    원격 값이 바뀌었거나 확인 간격을 바꿔야 할 때만 전체 rerun
+    """
+    check_pending_save()
+    row = pull_remote_row()
+    applied = bool(row) and apply_remote_state(row)
+    if applied or current_refresh_sec() != refresh_sec:
+        st.rerun()
+
+if supabase:
+    remote_poller()
+
 # ========================= 배포용 참고 (Supabase 테이블) ========================= #
 with st.expander("Supabase 테이블 생성 SQL (참고)"):
     st.code(
@@ -359,6 +764,8 @@ create table if not exists public.timer_state (
 );
 insert into public.timer_state (id) values (1)
 on conflict (id) do nothing;
+-- Realtime으로 UPDATE를 push 받으려면 publication에 추가 (이미 추가돼 있으면 생략)
+alter publication supabase_realtime add table public.timer_state;
         """,
         language="sql",
     )